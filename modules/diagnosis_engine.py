@@ -84,8 +84,8 @@ def prioritize_diagnosis(
 
 def generate_action_plan(
     diagnosis_result: Dict,
-    spec_ Dict,
-    meta Dict
+    spec_data: Dict,
+    metadata: Dict
 ) -> Dict:
     """
     Generate action plan berdasarkan diagnosis
@@ -1,11 +1,37 @@
 """Modul untuk analisis data listrik (voltage, current, imbalance)"""
 from typing import Dict
+import numpy as np
 from utils.calculations import (
     calculate_voltage_imbalance,
     calculate_current_imbalance,
-    calculate_load_percentage
+    calculate_load_percentage,
+    IMBALANCE_STATUS_LABELS,
+    LOAD_STATUS_LABELS,
+    OVERALL_STATUS_LABELS,
+    LOAD_STATUS_SEVERITY,
+    LOAD_UNDERLOAD,
+    LOAD_NORMAL,
+    LOAD_OVERLOAD_WARNING,
+    LOAD_OVERLOAD_ALARM
 )
-from utils.lookup_tables import PUMP_SIZE_DEFAULTS
+from utils.lookup_tables import PUMP_SIZE_DEFAULTS, PUMP_FLA, BATCH_DTYPE
+
+_LOAD_STATUS_SEVERITY = np.array(LOAD_STATUS_SEVERITY, dtype=np.int8)
+
+# Template rekomendasi sebagai bound method str.format (di-parse sekali saat import)
+_TMPL_V_IMB = "⚠️ Voltage imbalance {}% > 2% - check power supply quality".format
+_TMPL_I_IMB = "⚠️ Current imbalance {}% > 5% - check winding & connections".format
+_TMPL_OVERLOAD_WARNING = "⚠️ Motor load {}% > 110% FLA - check pump head & impeller".format
+_TMPL_OVERLOAD_ALARM = "🚨 CRITICAL: Motor load {}% > 125% FLA - immediate action required".format
+_TMPL_UNDERLOAD = "⚠️ Motor underload {}% < 80% FLA - check if pump operating below BEP".format
+
+# Template rekomendasi load per kode load status (NORMAL tanpa rekomendasi)
+_LOAD_REC_TEMPLATES = [None] * len(LOAD_STATUS_LABELS)
+_LOAD_REC_TEMPLATES[LOAD_UNDERLOAD] = _TMPL_UNDERLOAD
+_LOAD_REC_TEMPLATES[LOAD_OVERLOAD_WARNING] = _TMPL_OVERLOAD_WARNING
+_LOAD_REC_TEMPLATES[LOAD_OVERLOAD_ALARM] = _TMPL_OVERLOAD_ALARM
+_LOAD_REC_TEMPLATES = tuple(_LOAD_REC_TEMPLATES)
+_REC_NORMAL = "✅ Electrical parameters within normal range"
 
 
 def analyze_electrical_conditions(
@@ -21,63 +47,50 @@ def analyze_electrical_conditions(
     Analisis kondisi listrik motor
     """
     # Get FLA from pump size
-    fla = PUMP_SIZE_DEFAULTS[pump_size]["fla_a"]
+    fla = PUMP_SIZE_DEFAULTS[pump_size]["fla"]
+    
+    # Average dihitung sekali, dipakai untuk imbalance & laporan
+    v_avg = (voltage_l1 + voltage_l2 + voltage_l3) / 3
+    i_avg = (current_l1 + current_l2 + current_l3) / 3
     
     # Calculate voltage imbalance
-    v_imbalance, v_status = calculate_voltage_imbalance(voltage_l1, voltage_l2, voltage_l3)
+    v_imbalance, v_code = calculate_voltage_imbalance(voltage_l1, voltage_l2, voltage_l3, v_avg)
     
     # Calculate current imbalance
-    i_imbalance, i_status = calculate_current_imbalance(current_l1, current_l2, current_l3)
+    i_imbalance, i_code = calculate_current_imbalance(current_l1, current_l2, current_l3, i_avg)
     
-    # Calculate average current & load
-    i_avg = (current_l1 + current_l2 + current_l3) / 3
-    load_pct, load_status = calculate_load_percentage(i_avg, fla)
-    
-    # Overall electrical status
-    if v_status == "ALARM" or i_status == "ALARM" or load_status == "OVERLOAD_ALARM":
-        overall_status = "CRITICAL"
-    elif v_status == "WARNING" or i_status == "WARNING" or load_status == "OVERLOAD_WARNING":
-        overall_status = "WARNING"
-    elif load_status == "UNDERLOAD":
-        overall_status = "WARNING"  # Underload juga bisa masalah
-    else:
-        overall_status = "NORMAL"
-    
-    # Recommendations
+    # Calculate load
+    load_pct, load_code = calculate_load_percentage(i_avg, fla)
+    
+    # Overall electrical status = severity tertinggi (underload juga WARNING)
+    overall_code = max(v_code, i_code, LOAD_STATUS_SEVERITY[load_code])
+    
+    v_status = IMBALANCE_STATUS_LABELS[v_code]
+    i_status = IMBALANCE_STATUS_LABELS[i_code]
+    load_status = LOAD_STATUS_LABELS[load_code]
+    overall_status = OVERALL_STATUS_LABELS[overall_code]
+    
+    # Recommendations (template load diambil langsung dari kode load)
     recommendations = []
     
     if v_imbalance > 2:
-        recommendations.append(
-            f"⚠️ Voltage imbalance {v_imbalance}% > 2% - check power supply quality"
-        )
+        recommendations.append(_TMPL_V_IMB(v_imbalance))
     
     if i_imbalance > 5:
-        recommendations.append(
-            f"⚠️ Current imbalance {i_imbalance}% > 5% - check winding & connections"
-        )
+        recommendations.append(_TMPL_I_IMB(i_imbalance))
     
-    if load_status == "OVERLOAD_WARNING":
-        recommendations.append(
-            f"⚠️ Motor load {load_pct}% > 110% FLA - check pump head & impeller"
-        )
-    elif load_status == "OVERLOAD_ALARM":
-        recommendations.append(
-            f"🚨 CRITICAL: Motor load {load_pct}% > 125% FLA - immediate action required"
-        )
-    elif load_status == "UNDERLOAD":
-        recommendations.append(
-            f"⚠️ Motor underload {load_pct}% < 80% FLA - check if pump operating below BEP"
-        )
+    if load_code != LOAD_NORMAL:
+        recommendations.append(_LOAD_REC_TEMPLATES[load_code](load_pct))
     
     if not recommendations:
-        recommendations.append("✅ Electrical parameters within normal range")
+        recommendations.append(_REC_NORMAL)
     
     return {
         "voltage": {
             "l1": voltage_l1,
             "l2": voltage_l2,
             "l3": voltage_l3,
-            "average": round((voltage_l1 + voltage_l2 + voltage_l3) / 3, 1),
+            "average": round(v_avg, 1),
             "imbalance_pct": v_imbalance,
             "status": v_status
         },
@@ -100,9 +113,71 @@ def analyze_electrical_conditions(
     }
 
 
+def analyze_electrical_conditions_batch(
+    voltages: np.ndarray,
+    currents: np.ndarray,
+    size_codes: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """
+    Analisis kondisi listrik banyak motor sekaligus (vectorized)
+    
+    voltages & currents berbentuk (N, 3) untuk L1/L2/L3, size_codes berisi
+    N kode ukuran pompa (int, lihat PUMP_SIZE_INDEX). Perhitungan & perbandingan
+    threshold dalam float64 seperti versi skalar, sehingga status identik
+    dengan analyze_electrical_conditions; nilai numerik hasil disimpan dalam
+    BATCH_DTYPE (float32) dan tidak dibulatkan. Status berupa kode int8
+    sesuai urutan IMBALANCE_STATUS_LABELS, LOAD_STATUS_LABELS &
+    OVERALL_STATUS_LABELS.
+    """
+    V = np.asarray(voltages, dtype=np.float64)
+    I = np.asarray(currents, dtype=np.float64)
+    fla = PUMP_FLA[size_codes]
+    
+    # Imbalance = deviasi maksimum terhadap rata-rata per baris. Baris dengan
+    # rata-rata 0 (motor berhenti) diberi imbalance 0, bukan NaN yang akan
+    # gagal di semua perbandingan threshold & terbaca ALARM
+    v_avg = V.mean(axis=1)
+    i_avg = I.mean(axis=1)
+    
+    with np.errstate(divide="ignore", invalid="ignore"):
+        v_imbalance = np.where(
+            v_avg != 0, (np.abs(V - v_avg[:, None]).max(axis=1) / v_avg) * 100, 0
+        )
+        i_imbalance = np.where(
+            i_avg != 0, (np.abs(I - i_avg[:, None]).max(axis=1) / i_avg) * 100, 0
+        )
+    
+    load_pct = (i_avg / fla.astype(np.float64)) * 100
+    
+    # Threshold sama dengan versi skalar di utils.calculations
+    v_status = np.where(v_imbalance <= 2, 0, np.where(v_imbalance <= 5, 1, 2)).astype(np.int8)
+    i_status = np.where(i_imbalance <= 5, 0, np.where(i_imbalance <= 10, 1, 2)).astype(np.int8)
+    load_status = np.where(
+        load_pct < 80, 0,
+        np.where(load_pct <= 110, 1, np.where(load_pct <= 125, 2, 3))
+    ).astype(np.int8)
+    
+    # Overall = severity tertinggi (underload juga WARNING)
+    overall_status = np.maximum.reduce([v_status, i_status, _LOAD_STATUS_SEVERITY[load_status]])
+    
+    return {
+        "voltage_avg": v_avg.astype(BATCH_DTYPE),
+        "voltage_imbalance_pct": v_imbalance.astype(BATCH_DTYPE),
+        "voltage_status": v_status,
+        "current_avg": i_avg.astype(BATCH_DTYPE),
+        "current_imbalance_pct": i_imbalance.astype(BATCH_DTYPE),
+        "current_status": i_status,
+        "fla": fla,
+        "load_pct": load_pct.astype(BATCH_DTYPE),
+        "load_status": load_status,
+        "overall_status": overall_status,
+        "has_issue": overall_status != 0
+    }
+
+
 def generate_electrical_report(
-    electrical_ Dict,
-    spec_ Dict
+    electrical_data: Dict,
+    spec_data: Dict
 ) -> Dict:
     """
     Generate laporan analisis listrik
@@ -3,7 +3,10 @@ from typing import Dict
 from utils.calculations import (
     calculate_npsha,
     calculate_differential_head,
-    calculate_flow_ratio
+    calculate_flow_ratio,
+    FLOW_STATUS_NORMAL,
+    FLOW_STATUS_RECIRCULATION,
+    FLOW_STATUS_OVERLOAD
 )
 from utils.lookup_tables import PUMP_SIZE_DEFAULTS
 
@@ -20,8 +23,8 @@ def analyze_hydraulic_conditions(
     Analisis kondisi hidraulis pompa
     """
     # Get pump defaults
-    npshr = PUMP_SIZE_DEFAULTS[pump_size]["npshr_m"]
-    bep_flow = PUMP_SIZE_DEFAULTS[pump_size]["bep_flow_m3h"]
+    npshr = PUMP_SIZE_DEFAULTS[pump_size]["npshr"]
+    bep_flow = PUMP_SIZE_DEFAULTS[pump_size]["bep_flow"]
     
     # Calculate NPSHa
     npsha = calculate_npsha(suction_pressure, product_type, temperature)
@@ -47,9 +50,9 @@ def analyze_hydraulic_conditions(
         cavitation_status = "✅ NPSHa adequate"
     
     # Assess flow condition
-    if flow_status == "RECIRCULATION_RISK":
+    if flow_status == FLOW_STATUS_RECIRCULATION:
         flow_recommendation = "⚠️ Flow < 60% BEP - risk of recirculation & vibration"
-    elif flow_status == "OVERLOAD_CAVITATION_RISK":
+    elif flow_status == FLOW_STATUS_OVERLOAD:
         flow_recommendation = "⚠️ Flow > 120% BEP - risk of cavitation & overload"
     else:
         flow_recommendation = "✅ Flow within acceptable range"
@@ -66,12 +69,12 @@ def analyze_hydraulic_conditions(
         "flow_ratio": flow_ratio,
         "flow_status": flow_status,
         "flow_recommendation": flow_recommendation,
-        "has_issue": cavitation_risk != "LOW" or flow_status != "NORMAL"
+        "has_issue": cavitation_risk != "LOW" or flow_status != FLOW_STATUS_NORMAL
     }
 
 
 def generate_hydraulic_report(
-    operational_ Dict,
+    operational_data: Dict,
     spec_data: Dict
 ) -> Dict:
     """
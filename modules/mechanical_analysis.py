@@ -1,6 +1,17 @@
 """Modul untuk analisis kondisi mechanical (agregasi dari vibrasi)"""
 from typing import Dict
-from modules.vibration_analysis import generate_vibration_report
+from modules.vibration_analysis import generate_vibration_reports
+from utils.lookup_tables import ZONE_LETTERS, ZONE_INDEX
+
+# Rekomendasi per FaultCode (UNBALANCE, LOOSENESS, MISALIGNMENT)
+_FAULT_RECS = (
+    "🔧 Primary fault: Unbalance - perform dynamic balancing",
+    "🔧 Primary fault: Mechanical looseness - check foundation bolts & grouting",
+    "🔧 Primary fault: Misalignment - perform laser alignment"
+)
+
+# Kode zona minimum yang memerlukan tindakan (0..3 = A..D, jadi Zone C/D)
+_ACTION_ZONE_CODE = ZONE_INDEX["C"]
 
 
 def analyze_mechanical_conditions(
@@ -12,18 +23,9 @@ def analyze_mechanical_conditions(
     """
     Analisis kondisi mechanical pompa & motor
     """
-    # Analyze driver (motor)
-    driver_report = generate_vibration_report(
-        vibration_driver,
-        foundation_type,
-        product_type
-    )
-    
-    # Analyze driven (pump)
-    driven_report = generate_vibration_report(
-        vibration_driven,
-        foundation_type,
-        product_type
+    # Analyze driver (motor) & driven (pump) dengan foundation & produk yang sama
+    driver_report, driven_report = generate_vibration_reports(
+        (vibration_driver, vibration_driven), foundation_type, product_type
     )
     
     # Determine primary component issue
@@ -37,38 +39,26 @@ def analyze_mechanical_conditions(
         primary_component = "Pump (Driven)"
         primary_component_report = driven_report
     
-    # Overall mechanical status
-    overall_zone = max(
-        driver_report["overall_zone"],
-        driven_report["overall_zone"],
-        key=lambda z: ["A", "B", "C", "D"].index(z)
-    )
+    # Overall mechanical status (kode int, huruf zona hanya untuk output)
+    driver_zone_code = driver_report["overall_zone_code"]
+    driven_zone_code = driven_report["overall_zone_code"]
+    overall_zone_code = max(driver_zone_code, driven_zone_code)
+    overall_zone = ZONE_LETTERS[overall_zone_code]
     
     # Recommendations
     recommendations = []
     
-    if driver_report["overall_zone"] in ["C", "D"]:
+    if driver_zone_code >= _ACTION_ZONE_CODE:
         recommendations.append(
             f"⚠️ Motor vibration Zone {driver_report['overall_zone']} - check coupling alignment & rotor balance"
         )
     
-    if driven_report["overall_zone"] in ["C", "D"]:
+    if driven_zone_code >= _ACTION_ZONE_CODE:
         recommendations.append(
             f"⚠️ Pump vibration Zone {driven_report['overall_zone']} - check impeller balance & bearing condition"
         )
     
-    if primary_component_report["faults"]["primary_fault"] == "Unbalance (Impeller erosion/fouling)":
-        recommendations.append(
-            "🔧 Primary fault: Unbalance - perform dynamic balancing"
-        )
-    elif "Misalignment" in primary_component_report["faults"]["primary_fault"]:
-        recommendations.append(
-            "🔧 Primary fault: Misalignment - perform laser alignment"
-        )
-    elif "Looseness" in primary_component_report["faults"]["primary_fault"]:
-        recommendations.append(
-            "🔧 Primary fault: Mechanical looseness - check foundation bolts & grouting"
-        )
+    recommendations.append(_FAULT_RECS[primary_component_report["faults"]["primary_fault_code"]])
     
     if not recommendations:
         recommendations.append("✅ Mechanical vibration within acceptable limits")
@@ -81,5 +71,5 @@ def analyze_mechanical_conditions(
         "overall_severity": primary_component_report["severity"],
         "primary_fault": primary_component_report["faults"]["primary_fault"],
         "recommendations": recommendations,
-        "has_issue": overall_zone in ["C", "D"]
+        "has_issue": overall_zone_code >= _ACTION_ZONE_CODE
     }
@@ -85,7 +85,7 @@ def analyze_thermal_conditions(
     }
 
 
-def generate_thermal_report(thermal_ Dict) -> Dict:
+def generate_thermal_report(thermal_data: Dict) -> Dict:
     """
     Generate laporan analisis thermal
     """
@@ -1,96 +1,146 @@
 """Modul untuk analisis data vibrasi"""
-from typing import Dict
-from utils.lookup_tables import ISO_10816_3_LIMITS, FAULT_MAPPING
-from utils.calculations import get_zone_classification, get_zone_description
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from utils.calculations import get_zone_index
+from utils.lookup_tables import (
+    ISO_10816_3_THRESHOLDS_ROW,
+    ZONE_LETTERS,
+    ZONE_NAMES,
+    ZONE_COLORS,
+    ZONE_RECOMMENDATIONS,
+    FAULT_TUPLE,
+    FaultCode,
+    HF_CAVITATION_THRESHOLD,
+    HF_CAVITATION_THRESHOLDS,
+    BATCH_DTYPE
+)
+
+# Urutan arah (H, V, A); key data vibrasi per arah: (DE, NDE)
+DIRECTIONS = ("H", "V", "A")
+_VIB_KEYS = tuple((f"DE_{d}", f"NDE_{d}") for d in DIRECTIONS)
+
+# Confidence fault per arah: <= 2.8 LOW, <= 4.5 MEDIUM, > 4.5 HIGH
+CONFIDENCE_THRESHOLDS = (2.8, 4.5)
+CONFIDENCE_TUPLE = ("LOW", "MEDIUM", "HIGH")
+_CONFIDENCE_THRESHOLDS_BATCH = np.array(CONFIDENCE_THRESHOLDS, dtype=BATCH_DTYPE)
+
+
+def stack_vibration_data(vibration_records: Sequence[Dict]) -> np.ndarray:
+    """
+    Susun data vibrasi banyak pompa menjadi input generate_vibration_report_batch
+    
+    Hasil berbentuk (N, 3, 2) dalam BATCH_DTYPE: arah H/V/A x posisi DE/NDE;
+    key yang tidak ada diisi 0.0 seperti generate_vibration_report.
+    """
+    return np.array(
+        [[[data.get(key, 0.0) for key in keys] for keys in _VIB_KEYS] for data in vibration_records],
+        dtype=BATCH_DTYPE
+    ).reshape(-1, len(DIRECTIONS), 2)
+
+
+def _vib_values(vibration_data: Dict) -> Tuple[float, ...]:
+    """Nilai DE/NDE per arah sebagai tuple datar (DE_H, NDE_H, DE_V, ...)"""
+    return tuple(vibration_data.get(key, 0.0) for keys in _VIB_KEYS for key in keys)
+
+
+def _average_vibration(values: Tuple[float, ...]) -> Tuple[float, float, float]:
+    """Avr per arah (H, V, A) dari hasil _vib_values, dibulatkan 2 desimal"""
+    return tuple(round((de + nde) / 2, 2) for de, nde in zip(values[::2], values[1::2]))
+
+
+def _zone_indices(avgs: Tuple[float, ...], foundation_type: str) -> Tuple[int, ...]:
+    """Indeks zona ISO 10816-3 per arah dari Avr (H, V, A)"""
+    return tuple(get_zone_index(v, foundation_type) for v in avgs)
+
+
+def _fault_indices(avgs: Tuple[float, ...]) -> Tuple[Tuple[int, ...], int]:
+    """(conf_idx per arah, indeks arah dominan) dari Avr (H, V, A)"""
+    conf_idx = tuple(bisect_left(CONFIDENCE_THRESHOLDS, v) for v in avgs)
+    return conf_idx, avgs.index(max(avgs))
+
+
+def _analyze_vibration_core(avgs: Tuple[float, ...], foundation_type: str) -> Tuple:
+    """Kernel klasifikasi vibrasi: (zone_idx, conf_idx, primary_idx) dari Avr (H, V, A)"""
+    return (_zone_indices(avgs, foundation_type),) + _fault_indices(avgs)
+
+
+def _averages_to_dict(avgs: Tuple[float, ...]) -> Dict:
+    """Konversi Avr (H, V, A) ke format dict laporan"""
+    averages = {f"Avr_{d}": v for d, v in zip(DIRECTIONS, avgs)}
+    averages["Overall_Max"] = max(avgs)
+    return averages
 
 
 def calculate_average_vibration(vibration_data: Dict) -> Dict:
     """
     Hitung average per arah: Avr = (DE + NDE) / 2
     """
-    directions = ["H", "V", "A"]
-    averages = {}
-    
-    for direction in directions:
-        de_key = f"DE_{direction}"
-        nde_key = f"NDE_{direction}"
-        
-        de_value = vibration_data.get(de_key, 0.0)
-        nde_value = vibration_data.get(nde_key, 0.0)
-        
-        avg_value = (de_value + nde_value) / 2
-        averages[f"Avr_{direction}"] = round(avg_value, 2)
+    return _averages_to_dict(_average_vibration(_vib_values(vibration_data)))
+
+
+def _zones_from_idx(zone_idx: Tuple[int, ...]) -> Dict:
+    """Susun dict zona per arah dari indeks zona (H, V, A)"""
+    return {
+        f"Zone_{direction}": {
+            "zone": ZONE_LETTERS[i],
+            "name": ZONE_NAMES[i],
+            "color": ZONE_COLORS[i],
+            "recommendation": ZONE_RECOMMENDATIONS[i]
+        }
+        for direction, i in zip(DIRECTIONS, zone_idx)
+    }
+
+
+def _faults_from_idx(primary_idx: int, conf_idx: Tuple[int, ...]) -> Dict:
+    """Susun dict fault dari indeks arah dominan & indeks confidence (H, V, A)"""
+    faults = {
+        "primary_fault": FAULT_TUPLE[primary_idx],
+        "primary_fault_code": FaultCode(primary_idx),
+        "primary_direction": DIRECTIONS[primary_idx]
+    }
     
-    # Overall max (untuk summary)
-    averages["Overall_Max"] = max(averages.values())
+    # Fault per arah
+    for i, direction in enumerate(DIRECTIONS):
+        faults[f"fault_{direction}"] = {
+            "type": FAULT_TUPLE[i],
+            "confidence": CONFIDENCE_TUPLE[conf_idx[i]]
+        }
     
-    return averages
+    return faults
+
+
+def _avgs_from_dict(averages: Dict) -> Tuple[float, float, float]:
+    """Avr (H, V, A) dari dict hasil calculate_average_vibration"""
+    return tuple(averages.get(f"Avr_{d}", 0.0) for d in DIRECTIONS)
 
 
 def classify_vibration_zones(averages: Dict, foundation_type: str = "rigid") -> Dict:
     """
     Klasifikasikan zona ISO 10816-3 per arah
     """
-    zones = {}
-    directions = ["H", "V", "A"]
-    
-    for direction in directions:
-        avg_key = f"Avr_{direction}"
-        avg_value = averages.get(avg_key, 0.0)
-        
-        zone = get_zone_classification(avg_value, foundation_type)
-        zone_desc = get_zone_description(zone)
-        
-        zones[f"Zone_{direction}"] = {
-            "zone": zone,
-            "name": zone_desc["name"],
-            "color": zone_desc["color"],
-            "recommendation": zone_desc["recommendation"]
-        }
-    
-    return zones
+    return _zones_from_idx(_zone_indices(_avgs_from_dict(averages), foundation_type))
 
 
 def identify_fault_indicators(averages: Dict) -> Dict:
     """
     Identifikasi kemungkinan fault berdasarkan arah dominan
     """
-    directions = ["H", "V", "A"]
-    faults = {}
-    
     # Primary fault (arah dengan Avr tertinggi)
-    max_direction = max(directions, key=lambda d: averages.get(f"Avr_{d}", 0))
-    primary_fault = FAULT_MAPPING[max_direction]
-    
-    faults["primary_fault"] = primary_fault
-    faults["primary_direction"] = max_direction
-    
-    # Fault per arah
-    for direction in directions:
-        avg_key = f"Avr_{direction}"
-        avg_value = averages.get(avg_key, 0.0)
-        
-        fault_type = FAULT_MAPPING[direction]
-        faults[f"fault_{direction}"] = {
-            "type": fault_type,
-            "confidence": "HIGH" if avg_value > 4.5 else "MEDIUM" if avg_value > 2.8 else "LOW"
-        }
-    
-    return faults
+    conf_idx, primary_idx = _fault_indices(_avgs_from_dict(averages))
+    return _faults_from_idx(primary_idx, conf_idx)
 
 
-def analyze_hf_vibration(vibration_ Dict, product_type: str) -> Dict:
+def analyze_hf_vibration(vibration_data: Dict, product_type: str) -> Dict:
     """
     Analisis high-frequency vibration untuk cavitation & bearing defect
     """
     hf_value = vibration_data.get("HF_5_16kHz", 0.0)
     demod_value = vibration_data.get("Demodulation", 0.0)
     
-    # Threshold adjustment berdasarkan produk
-    if product_type in ["Gasoline", "Avtur", "Naphtha"]:
-        cavitation_threshold = 0.3  # Lebih sensitif untuk produk volatile
-    else:
-        cavitation_threshold = 0.5
+    # Threshold adjustment berdasarkan produk (volatile lebih sensitif)
+    cavitation_threshold = HF_CAVITATION_THRESHOLD.get(product_type, 0.5)
     
     analysis = {
         "hf_value": hf_value,
@@ -110,38 +160,113 @@ def analyze_hf_vibration(vibration_ Dict, product_type: str) -> Dict:
     return analysis
 
 
+def _assemble_vibration_report(
+    vibration_data: Dict,
+    avgs: Tuple[float, ...],
+    zone_idx: Tuple[int, ...],
+    conf_idx: Tuple[int, ...],
+    primary_idx: int,
+    product_type: str
+) -> Dict:
+    """Susun dict laporan vibrasi dari hasil analisis satu komponen"""
+    # Overall assessment = zona terburuk
+    overall_idx = max(zone_idx)
+    
+    return {
+        "averages": _averages_to_dict(avgs),
+        "zones": _zones_from_idx(zone_idx),
+        "faults": _faults_from_idx(primary_idx, conf_idx),
+        "hf_analysis": analyze_hf_vibration(vibration_data, product_type),
+        "overall_zone": ZONE_LETTERS[overall_idx],
+        "overall_zone_code": overall_idx,
+        "severity": ZONE_NAMES[overall_idx],
+        "recommendation": ZONE_RECOMMENDATIONS[overall_idx]
+    }
+
+
+@lru_cache(maxsize=256)
+def _cached_vibration_core(values: Tuple[float, ...], foundation_type: str) -> Tuple:
+    """
+    Memoization (avgs, zone_idx, conf_idx, primary_idx) per kombinasi nilai DE/NDE
+    
+    Hanya tuple immutable yang di-cache; dict laporan dibangun baru per panggilan.
+    """
+    avgs = _average_vibration(values)
+    return (avgs,) + _analyze_vibration_core(avgs, foundation_type)
+
+
 def generate_vibration_report(
-    vibration_ Dict,
+    vibration_data: Dict,
     foundation_type: str = "rigid",
     product_type: str = "Diesel"
 ) -> Dict:
     """
     Generate laporan lengkap analisis vibrasi
+    
+    Avr & klasifikasi di-cache per kombinasi input (rerun Streamlit dengan
+    data sama tidak dihitung ulang); dict hasil selalu baru & boleh diubah.
     """
-    # Hitung average
-    averages = calculate_average_vibration(vibration_data)
+    core = _cached_vibration_core(_vib_values(vibration_data), foundation_type)
+    return _assemble_vibration_report(vibration_data, *core, product_type)
+
+
+def generate_vibration_reports(
+    vibration_records: Sequence[Dict],
+    foundation_type: str = "rigid",
+    product_type: str = "Diesel"
+) -> List[Dict]:
+    """
+    Generate laporan vibrasi per komponen satu pompa (mis. driver & driven)
+    dengan foundation & produk yang sama
+    
+    Tiap komponen lewat jalur & cache yang sama dengan generate_vibration_report.
+    """
+    return [
+        generate_vibration_report(vibration_data, foundation_type, product_type)
+        for vibration_data in vibration_records
+    ]
+
+
+def generate_vibration_report_batch(
+    vib_arr: np.ndarray,
+    foundation_types: np.ndarray,
+    product_codes: np.ndarray,
+    hf_arr: Optional[np.ndarray] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Analisis vibrasi banyak pompa sekaligus
     
-    # Klasifikasi zona
-    zones = classify_vibration_zones(averages, foundation_type)
+    vib_arr berbentuk (N, 3, 2): arah H/V/A x posisi DE/NDE per pompa
+    (hasil stack_vibration_data).
+    foundation_types & product_codes berisi kode int (FOUNDATION_INDEX,
+    PRODUCT_INDEX); hf_arr opsional berbentuk (N, 2): HF_5_16kHz, Demodulation.
+    Perhitungan dalam BATCH_DTYPE (float32) & Avr dibulatkan dengan
+    np.round, sehingga nilai tepat di batas zona bisa berbeda dibanding
+    generate_vibration_report.
     
-    # Identifikasi fault
-    faults = identify_fault_indicators(averages)
+    Hasil berupa dict of ndarray (indeks zona, arah & confidence), bukan
+    list of dict; indeks zona langsung dipakai ke ZONE_NAMES/ZONE_LABELS.
+    """
+    vib_arr = np.asarray(vib_arr, dtype=BATCH_DTYPE)
+    avgs = vib_arr.mean(axis=2).round(2)
     
-    # Analisis HF
-    hf_analysis = analyze_hf_vibration(vibration_data, product_type)
+    # Threshold berbeda per baris, jadi zona dihitung dari jumlah threshold
+    # yang tidak dilampaui (sama dengan get_zone_index; NaN -> D, fail-safe)
+    thresholds = ISO_10816_3_THRESHOLDS_ROW[foundation_types]
+    zone_idx = 3 - (avgs[:, :, None] <= thresholds[:, None, :]).sum(axis=2)
+    conf_idx = np.searchsorted(_CONFIDENCE_THRESHOLDS_BATCH, avgs)
     
-    # Overall assessment
-    overall_zone = max(
-        [zones[f"Zone_{d}"]["zone"] for d in ["H", "V", "A"]],
-        key=lambda z: ["A", "B", "C", "D"].index(z)
-    )
+    if hf_arr is None:
+        hf_arr = np.zeros((len(avgs), 2), dtype=BATCH_DTYPE)
+    hf_arr = np.asarray(hf_arr, dtype=BATCH_DTYPE)
     
     return {
-        "averages": averages,
-        "zones": zones,
-        "faults": faults,
-        "hf_analysis": hf_analysis,
-        "overall_zone": overall_zone,
-        "severity": get_zone_description(overall_zone)["name"],
-        "recommendation": get_zone_description(overall_zone)["recommendation"]
+        "averages": avgs,
+        "overall_max": avgs.max(axis=1),
+        "zone_idx": zone_idx,
+        "overall_zone_idx": zone_idx.max(axis=1),
+        "primary_direction_idx": avgs.argmax(axis=1),
+        "confidence_idx": conf_idx,
+        "cavitation_risk": hf_arr[:, 0] > HF_CAVITATION_THRESHOLDS[product_codes],
+        "bearing_defect_risk": hf_arr[:, 1] > 0.5
     }
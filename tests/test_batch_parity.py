@@ -0,0 +1,119 @@
+"""Paritas hasil analisis batch (vectorized) terhadap versi skalar"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.electrical_analysis import (  # noqa: E402
+    analyze_electrical_conditions,
+    analyze_electrical_conditions_batch
+)
+from modules.vibration_analysis import (  # noqa: E402
+    CONFIDENCE_TUPLE,
+    DIRECTIONS,
+    generate_vibration_report,
+    generate_vibration_report_batch,
+    stack_vibration_data
+)
+from utils.calculations import (  # noqa: E402
+    IMBALANCE_STATUS_LABELS,
+    LOAD_STATUS_LABELS,
+    OVERALL_STATUS_LABELS,
+    get_zone_classification
+)
+from utils.lookup_tables import (  # noqa: E402
+    FOUNDATION_INDEX,
+    PRODUCT_INDEX,
+    PUMP_SIZE_INDEX,
+    ZONE_LETTERS
+)
+
+NAN = float("nan")
+_VIB_KEYS = [f"{pos}_{d}" for pos in ("DE", "NDE") for d in DIRECTIONS]
+
+
+def _electrical_cases():
+    """Data lapangan (resolusi 0.1) + kasus batas & NaN"""
+    rng = np.random.default_rng(0)
+    cases = [
+        (tuple(np.round(rng.uniform(360, 400, 3), 1)), tuple(np.round(rng.uniform(5, 80, 3), 1)), size)
+        for size in PUMP_SIZE_INDEX
+        for _ in range(2000)
+    ]
+    cases += [
+        ((380.0, 380.0, 380.0), (38.8, 29.2, 31.0), "Medium"),
+        ((102.0, 100.0, 98.0), (33.0, 33.0, 33.0), "Medium"),
+        ((380.0, 380.0, 380.0), (24.0, 24.0, 24.0), "Medium"),
+        ((380.0, 380.0, 380.0), (37.5, 37.5, 37.5), "Medium"),
+        ((0.0, 0.0, 0.0), (0.0, 0.0, 0.0), "Small"),
+        ((380.0, 380.0, NAN), (30.0, 30.0, 30.0), "Medium"),
+        ((380.0, 380.0, 380.0), (30.0, 30.0, NAN), "Large"),
+    ]
+    return cases
+
+
+def test_electrical_batch_status_matches_scalar():
+    cases = _electrical_cases()
+    batch = analyze_electrical_conditions_batch(
+        np.array([v for v, _, _ in cases]),
+        np.array([c for _, c, _ in cases]),
+        np.array([PUMP_SIZE_INDEX[s] for _, _, s in cases])
+    )
+
+    for k, (v, c, size) in enumerate(cases):
+        scalar = analyze_electrical_conditions(*map(float, v), *map(float, c), size)
+        assert (
+            scalar["voltage"]["status"],
+            scalar["current"]["status"],
+            scalar["load"]["status"],
+            scalar["overall_status"]
+        ) == (
+            IMBALANCE_STATUS_LABELS[batch["voltage_status"][k]],
+            IMBALANCE_STATUS_LABELS[batch["current_status"][k]],
+            LOAD_STATUS_LABELS[batch["load_status"][k]],
+            OVERALL_STATUS_LABELS[batch["overall_status"][k]]
+        ), (v, c, size)
+
+
+def test_vibration_batch_matches_scalar():
+    # Kelipatan 0.5 mm/s: Avr eksak di float32 & float64 (termasuk tepat 4.5)
+    rng = np.random.default_rng(1)
+    records = [dict(zip(_VIB_KEYS, rng.integers(0, 30, 6) / 2)) for _ in range(2000)]
+    foundations = rng.choice(list(FOUNDATION_INDEX), len(records))
+    products = rng.choice(list(PRODUCT_INDEX), len(records))
+
+    batch = generate_vibration_report_batch(
+        stack_vibration_data(records),
+        np.array([FOUNDATION_INDEX[f] for f in foundations]),
+        np.array([PRODUCT_INDEX[p] for p in products])
+    )
+
+    for k, data in enumerate(records):
+        report = generate_vibration_report(data, foundations[k], products[k])
+        assert [report["zones"][f"Zone_{d}"]["zone"] for d in DIRECTIONS] == [
+            ZONE_LETTERS[z] for z in batch["zone_idx"][k]
+        ], data
+        assert report["overall_zone_code"] == batch["overall_zone_idx"][k]
+        assert [report["faults"][f"fault_{d}"]["confidence"] for d in DIRECTIONS] == [
+            CONFIDENCE_TUPLE[c] for c in batch["confidence_idx"][k]
+        ], data
+        assert report["faults"]["primary_direction"] == DIRECTIONS[batch["primary_direction_idx"][k]]
+
+
+@pytest.mark.parametrize("foundation_type", list(FOUNDATION_INDEX))
+def test_nan_vibration_is_zone_d(foundation_type):
+    assert get_zone_classification(NAN, foundation_type) == "D"
+    assert get_zone_classification(np.array([NAN]), foundation_type)[0] == "D"
+
+    data = {"DE_H": NAN, "NDE_H": 1.0}
+    assert generate_vibration_report(data, foundation_type)["overall_zone"] == "D"
+
+    batch = generate_vibration_report_batch(
+        stack_vibration_data([data]),
+        np.array([FOUNDATION_INDEX[foundation_type]]),
+        np.array([PRODUCT_INDEX["Diesel"]])
+    )
+    assert batch["zone_idx"][0, 0] == ZONE_LETTERS.index("D")
@@ -1,7 +1,19 @@
 """Utility functions untuk perhitungan teknis"""
 import math
-from typing import Dict, Tuple
-from utils.lookup_tables import PRODUCT_PROPERTIES, PUMP_SIZE_DEFAULTS, ISO_10816_3_LIMITS
+from typing import Dict, Optional, Tuple, Union
+import numpy as np
+from utils.lookup_tables import (
+    PRODUCT_PROPERTIES,
+    PUMP_SIZE_DEFAULTS,
+    ISO_10816_3_THRESHOLDS,
+    ZONE_LETTERS,
+    ZONE_LABELS,
+    ZONE_INDEX,
+    ZONE_NAMES,
+    ZONE_COLORS,
+    ZONE_RECOMMENDATIONS,
+    ZONE_TIMELINES
+)
 
 
 def calculate_npsha(
@@ -59,99 +71,116 @@ def calculate_differential_head(
     return round(head_m, 2)
 
 
-def calculate_voltage_imbalance(v1: float, v2: float, v3: float) -> Tuple[float, str]:
-    """Hitung voltage imbalance percentage"""
-    v_avg = (v1 + v2 + v3) / 3
-    max_dev = max(abs(v1 - v_avg), abs(v2 - v_avg), abs(v3 - v_avg))
-    imbalance_pct = (max_dev / v_avg) * 100
+# Kode status int -> label; kode dihitung branchless dari perbandingan threshold
+IMBALANCE_STATUS_LABELS = ("NORMAL", "WARNING", "ALARM")
+LOAD_STATUS_LABELS = ("UNDERLOAD", "NORMAL", "OVERLOAD_WARNING", "OVERLOAD_ALARM")
+OVERALL_STATUS_LABELS = ("NORMAL", "WARNING", "CRITICAL")
+
+# Status flow ratio
+FLOW_STATUS_NORMAL = "NORMAL"
+FLOW_STATUS_RECIRCULATION = "RECIRCULATION_RISK"
+FLOW_STATUS_OVERLOAD = "OVERLOAD_CAVITATION_RISK"
+
+# Kode load status, diambil dari posisi label di LOAD_STATUS_LABELS
+LOAD_UNDERLOAD = LOAD_STATUS_LABELS.index("UNDERLOAD")
+LOAD_NORMAL = LOAD_STATUS_LABELS.index("NORMAL")
+LOAD_OVERLOAD_WARNING = LOAD_STATUS_LABELS.index("OVERLOAD_WARNING")
+LOAD_OVERLOAD_ALARM = LOAD_STATUS_LABELS.index("OVERLOAD_ALARM")
+
+# Severity (kode OVERALL_STATUS_LABELS) per kode load status
+LOAD_STATUS_SEVERITY = (1, 0, 1, 2)
+
+
+def _imbalance_from_avg(x1: float, x2: float, x3: float, x_avg: float) -> float:
+    """Imbalance percentage 3 fasa (belum dibulatkan) dari rata-rata yang sudah dihitung"""
+    if x_avg == 0:
+        return 0.0  # Semua fasa 0 (motor berhenti) - tidak ada imbalance
+    max_dev = max(abs(x1 - x_avg), abs(x2 - x_avg), abs(x3 - x_avg))
+    return (max_dev / x_avg) * 100
+
+
+def calculate_voltage_imbalance(
+    v1: float,
+    v2: float,
+    v3: float,
+    v_avg: Optional[float] = None
+) -> Tuple[float, int]:
+    """Hitung voltage imbalance percentage & kode status (IMBALANCE_STATUS_LABELS)"""
+    if v_avg is None:
+        v_avg = (v1 + v2 + v3) / 3
+    imbalance_pct = _imbalance_from_avg(v1, v2, v3, v_avg)
     
-    status = "NORMAL" if imbalance_pct <= 2 else "WARNING" if imbalance_pct <= 5 else "ALARM"
+    # 0 = NORMAL (<= 2%), 1 = WARNING (<= 5%), 2 = ALARM (termasuk NaN, fail-safe)
+    code = 2 - (imbalance_pct <= 5) - (imbalance_pct <= 2)
     
-    return round(imbalance_pct, 2), status
-
-
-def calculate_current_imbalance(i1: float, i2: float, i3: float) -> Tuple[float, str]:
-    """Hitung current imbalance percentage"""
-    i_avg = (i1 + i2 + i3) / 3
-    max_dev = max(abs(i1 - i_avg), abs(i2 - i_avg), abs(i3 - i_avg))
-    imbalance_pct = (max_dev / i_avg) * 100
+    return round(imbalance_pct, 2), code
+
+
+def calculate_current_imbalance(
+    i1: float,
+    i2: float,
+    i3: float,
+    i_avg: Optional[float] = None
+) -> Tuple[float, int]:
+    """Hitung current imbalance percentage & kode status (IMBALANCE_STATUS_LABELS)"""
+    if i_avg is None:
+        i_avg = (i1 + i2 + i3) / 3
+    imbalance_pct = _imbalance_from_avg(i1, i2, i3, i_avg)
     
-    status = "NORMAL" if imbalance_pct <= 5 else "WARNING" if imbalance_pct <= 10 else "ALARM"
+    # 0 = NORMAL (<= 5%), 1 = WARNING (<= 10%), 2 = ALARM (termasuk NaN, fail-safe)
+    code = 2 - (imbalance_pct <= 10) - (imbalance_pct <= 5)
     
-    return round(imbalance_pct, 2), status
+    return round(imbalance_pct, 2), code
 
 
-def calculate_load_percentage(current_avg: float, fla: float) -> Tuple[float, str]:
-    """Hitung motor load percentage"""
+def calculate_load_percentage(current_avg: float, fla: float) -> Tuple[float, int]:
+    """Hitung motor load percentage & kode status (LOAD_STATUS_LABELS)"""
     load_pct = (current_avg / fla) * 100
     
-    if load_pct < 80:
-        status = "UNDERLOAD"
-    elif load_pct <= 110:
-        status = "NORMAL"
-    elif load_pct <= 125:
-        status = "OVERLOAD_WARNING"
-    else:
-        status = "OVERLOAD_ALARM"
+    # 0 = UNDERLOAD (< 80%), 1 = NORMAL (<= 110%), 2 = OVERLOAD_WARNING (<= 125%),
+    # 3 = OVERLOAD_ALARM (termasuk NaN, fail-safe)
+    code = 3 - (load_pct <= 125) - (load_pct <= 110) - (load_pct < 80)
     
-    return round(load_pct, 1), status
+    return round(load_pct, 1), code
 
 
 def calculate_flow_ratio(flow_rate: float, pump_size: str) -> Tuple[float, str]:
     """Hitung ratio flow terhadap BEP"""
-    bep_flow = PUMP_SIZE_DEFAULTS[pump_size]["bep_flow_m3h"]
+    bep_flow = PUMP_SIZE_DEFAULTS[pump_size]["bep_flow"]
     ratio = flow_rate / bep_flow
     
     if ratio < 0.6:
-        status = "RECIRCULATION_RISK"
+        status = FLOW_STATUS_RECIRCULATION
     elif ratio > 1.2:
-        status = "OVERLOAD_CAVITATION_RISK"
+        status = FLOW_STATUS_OVERLOAD
     else:
-        status = "NORMAL"
+        status = FLOW_STATUS_NORMAL
     
     return round(ratio, 2), status
 
 
-def get_zone_classification(avr_value: float, foundation_type: str = "rigid") -> str:
-    """Klasifikasi zona ISO 10816-3"""
-    limits = ISO_10816_3_LIMITS[foundation_type]
-    
-    if avr_value <= limits["zone_a_max"]:
-        return "A"
-    elif avr_value <= limits["zone_b_max"]:
-        return "B"
-    elif avr_value <= limits["zone_c_max"]:
-        return "C"
-    else:
-        return "D"
+def get_zone_index(avr_value: float, foundation_type: str = "rigid") -> int:
+    """Kode zona ISO 10816-3 (0..3 = A..D) untuk satu nilai Avr (NaN -> D, fail-safe)"""
+    zone_a_max, zone_b_max, zone_c_max = ISO_10816_3_THRESHOLDS[foundation_type]
+    return 3 - (avr_value <= zone_c_max) - (avr_value <= zone_b_max) - (avr_value <= zone_a_max)
+
+
+def get_zone_classification(
+    avr_value: Union[float, np.ndarray],
+    foundation_type: str = "rigid"
+) -> Union[str, np.ndarray]:
+    """Klasifikasi zona ISO 10816-3 (skalar atau array nilai Avr)"""
+    if isinstance(avr_value, np.ndarray):
+        return ZONE_LABELS[np.searchsorted(ISO_10816_3_THRESHOLDS[foundation_type], avr_value)]
+    return ZONE_LETTERS[get_zone_index(avr_value, foundation_type)]
 
 
 def get_zone_description(zone: str) -> Dict:
     """Dapatkan deskripsi & rekomendasi per zona"""
-    descriptions = {
-        "A": {
-            "name": "Normal",
-            "color": "green",
-            "recommendation": "Continue monitoring",
-            "timeline": "Quarterly"
-        },
-        "B": {
-            "name": "Satisfactory",
-            "color": "yellow",
-            "recommendation": "Investigate within 30 days",
-            "timeline": "Monthly"
-        },
-        "C": {
-            "name": "Unsatisfactory",
-            "color": "orange",
-            "recommendation": "Repair within 14 days",
-            "timeline": "< 14 days"
-        },
-        "D": {
-            "name": "Unacceptable",
-            "color": "red",
-            "recommendation": "Immediate shutdown or repair within 72 hours",
-            "timeline": "< 72 hours"
-        }
+    i = ZONE_INDEX.get(zone, 0)
+    return {
+        "name": ZONE_NAMES[i],
+        "color": ZONE_COLORS[i],
+        "recommendation": ZONE_RECOMMENDATIONS[i],
+        "timeline": ZONE_TIMELINES[i]
     }
-    return descriptions.get(zone, descriptions["A"])
@@ -1,4 +1,6 @@
 """Lookup tables embedded directly in code (no external CSV needed)"""
+from enum import IntEnum
+import numpy as np
 
 # Vapor pressure approximation (kPa) for common products at various temperatures
 VAPOR_PRESSURE_TABLE = {
@@ -16,21 +18,31 @@ VAPOR_PRESSURE_TABLE = {
     }
 }
 
-# Pump size class defaults (NPSHr, BEP flow, FLA)
+# Pump size class defaults (NPSHr m, BEP flow m³/h, FLA A);
+# npshr_m / bep_flow_m3h / fla_a = alias key lama (backward compatibility)
 PUMP_SIZE_DEFAULTS = {
     "Small": {
+        "npshr": 3.0,
+        "bep_flow": 30,
+        "fla": 15,
         "npshr_m": 3.0,
         "bep_flow_m3h": 30,
         "fla_a": 15,
         "typical_head_m": 25
     },
     "Medium": {
+        "npshr": 4.5,
+        "bep_flow": 100,
+        "fla": 30,
         "npshr_m": 4.5,
         "bep_flow_m3h": 100,
         "fla_a": 30,
         "typical_head_m": 50
     },
     "Large": {
+        "npshr": 6.0,
+        "bep_flow": 250,
+        "fla": 60,
         "npshr_m": 6.0,
         "bep_flow_m3h": 250,
         "fla_a": 60,
@@ -38,6 +50,16 @@ PUMP_SIZE_DEFAULTS = {
     }
 }
 
+# Presisi array untuk analisis batch (fleet/time-series); data lapangan
+# jarang melebihi 3 angka penting, float32 cukup & setengah bandwidth float64
+BATCH_DTYPE = np.float32
+
+# PUMP_SIZE_DEFAULTS versi array (SoA), diindeks kode ukuran int
+PUMP_SIZE_INDEX = {"Small": 0, "Medium": 1, "Large": 2}
+PUMP_FLA = np.array([PUMP_SIZE_DEFAULTS[s]["fla"] for s in PUMP_SIZE_INDEX], dtype=BATCH_DTYPE)
+PUMP_NPSHR = np.array([PUMP_SIZE_DEFAULTS[s]["npshr"] for s in PUMP_SIZE_INDEX], dtype=BATCH_DTYPE)
+PUMP_BEP_FLOW = np.array([PUMP_SIZE_DEFAULTS[s]["bep_flow"] for s in PUMP_SIZE_INDEX], dtype=BATCH_DTYPE)
+
 # ISO 10816-3 vibration limits (mm/s RMS) for Class III machines
 ISO_10816_3_LIMITS = {
     "rigid": {
@@ -54,34 +76,83 @@ ISO_10816_3_LIMITS = {
     }
 }
 
-# Product properties (density kg/m³, risk factor 1-5)
+# Batas atas zona A/B/C per foundation type, untuk get_zone_index / np.searchsorted
+# (side="left" -> nilai tepat di batas masuk zona bawah, sama dengan <=)
+ISO_10816_3_THRESHOLDS = {
+    foundation: (limits["zone_a_max"], limits["zone_b_max"], limits["zone_c_max"])
+    for foundation, limits in ISO_10816_3_LIMITS.items()
+}
+
+# Kode int foundation type & threshold per baris (2, 3) untuk analisis batch.
+# Versi skalar tetap float64: float32(2.8) < 2.8 sehingga nilai tepat di batas
+# akan bergeser zona jika dibandingkan dengan Avr float64
+FOUNDATION_INDEX = {"rigid": 0, "flexible": 1}
+ISO_10816_3_THRESHOLDS_ROW = np.array(
+    [ISO_10816_3_THRESHOLDS[f] for f in FOUNDATION_INDEX], dtype=BATCH_DTYPE
+)
+
+# Label zona per indeks zona (tuple untuk skalar, array untuk indeks ndarray)
+ZONE_LETTERS = ("A", "B", "C", "D")
+ZONE_LABELS = np.array(ZONE_LETTERS)
+ZONE_INDEX = {zone: i for i, zone in enumerate(ZONE_LETTERS)}
+
+# Deskripsi & rekomendasi per zona, diindeks 0..3 (A..D)
+ZONE_NAMES = ("Normal", "Satisfactory", "Unsatisfactory", "Unacceptable")
+ZONE_COLORS = ("green", "yellow", "orange", "red")
+ZONE_RECOMMENDATIONS = (
+    "Continue monitoring",
+    "Investigate within 30 days",
+    "Repair within 14 days",
+    "Immediate shutdown or repair within 72 hours"
+)
+ZONE_TIMELINES = ("Quarterly", "Monthly", "< 14 days", "< 72 hours")
+
+# Product properties (density kg/m³, risk factor 1-5);
+# density / default_temp = alias key src.config lama (backward compatibility)
 PRODUCT_PROPERTIES = {
     "Gasoline": {
         "density_kgm3": 740,
         "default_temp_c": 30,
+        "density": 740,
+        "default_temp": 30,
         "risk_factor": 5,
         "vapor_pressure_ref": "High volatility - cavitation critical"
     },
     "Diesel": {
         "density_kgm3": 840,
         "default_temp_c": 25,
+        "density": 840,
+        "default_temp": 25,
         "risk_factor": 3,
         "vapor_pressure_ref": "Low volatility - bearing wear dominant"
     },
     "Avtur": {
         "density_kgm3": 780,
         "default_temp_c": 28,
+        "density": 780,
+        "default_temp": 28,
         "risk_factor": 4,
         "vapor_pressure_ref": "Medium volatility - seal integrity critical"
     },
     "Naphtha": {
         "density_kgm3": 700,
         "default_temp_c": 32,
+        "density": 700,
+        "default_temp": 32,
         "risk_factor": 5,
         "vapor_pressure_ref": "Very high volatility - extreme cavitation risk"
     }
 }
 
+# Kode int produk untuk analisis batch
+PRODUCT_INDEX = {"Gasoline": 0, "Diesel": 1, "Avtur": 2, "Naphtha": 3}
+
+# Threshold HF 5-16 kHz (gE) untuk indikasi cavitation - produk volatile lebih sensitif
+HF_CAVITATION_THRESHOLD = {"Gasoline": 0.3, "Diesel": 0.5, "Avtur": 0.3, "Naphtha": 0.3}
+HF_CAVITATION_THRESHOLDS = np.array(
+    [HF_CAVITATION_THRESHOLD[p] for p in PRODUCT_INDEX], dtype=BATCH_DTYPE
+)
+
 # Fault mapping per vibration direction
 FAULT_MAPPING = {
     "H": "Unbalance (Impeller erosion/fouling)",
@@ -89,5 +160,15 @@ FAULT_MAPPING = {
     "A": "Misalignment (Coupling/pipe strain)"
 }
 
+# FAULT_MAPPING dalam urutan indeks arah H, V, A
+FAULT_TUPLE = tuple(FAULT_MAPPING[d] for d in ("H", "V", "A"))
+
+
+class FaultCode(IntEnum):
+    """Kode fault utama, sama dengan indeks arah di FAULT_TUPLE"""
+    UNBALANCE = 0
+    LOOSENESS = 1
+    MISALIGNMENT = 2
+
 # Diagnosis priority order (causal hierarchy)
 DIAGNOSIS_PRIORITY = ["HYDRAULIC", "ELECTRICAL", "MECHANICAL", "THERMAL"]